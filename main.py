@@ -1,21 +1,116 @@
 # SORSA CRYPTO INTELLIGENCE - RAILWAY DEPLOYMENT
 # Automated weekly discovery of early-stage crypto projects
 
-import requests
+import ahocorasick
+import asyncio
+import bisect
+import csv
+import itertools
+import httpx
+import numpy as np
 import pandas as pd
-import time
 import re
+import time
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import sqlite3
 import os
+import atexit
 from dataclasses import dataclass
+from types import MappingProxyType
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; the fetchers already log their own result lines
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+_URL_RE = re.compile(r'https?://\S+')
+_HANDLE_SANITIZE_RE = re.compile(r'[^\w\.]')
+
+
+def current_epoch_day() -> int:
+    return int(time.time()) // 86400
+
+
+@lru_cache(maxsize=100_000)
+def _age_weeks(created_at: str, now_day: int) -> int:
+    """Whole weeks between created_at and now_day (days since epoch, UTC)"""
+    try:
+        if created_at:
+            creation_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+            if creation_date.tzinfo is None:
+                creation_date = creation_date.replace(tzinfo=timezone.utc)
+            creation_day = int(creation_date.timestamp()) // 86400
+            return max(0, (now_day - creation_day) // 7)
+    except Exception as e:
+        logger.warning(f"Could not parse date {created_at}: {e}")
+    return 999
+
+
+# Power users with their signal scores
+_POWER_USERS_SCORES = MappingProxyType({
+    "NTmoney": 100, "zhusu": 100, "AriannaSimpson": 100, "santiagoroel": 100, 
+    "StaniKulechov": 100, "eddylazzarin": 100, "adampatel23": 100, "jbrukh": 100, 
+    "spencernoon": 100, "MonetSupply": 90, "arjunblj": 100, "janehk": 100, 
+    "Derekmw23": 100, "0xminion": 100, "MerschMax_": 100, "bneiluj": 100,
+    "Iiterature": 100, "panekkkk": 100, "zoink": 100, "gpl_94": 90, 
+    "WuCarra": 80, "bitcoinPalmer": 70, "Darrenlautf": 80, "john_c_palmer": 70, 
+    "lmrankhan": 70, "WPeaster": 80, "bottomd0g": 70, "dApp_boi": 70, 
+    "sethginns": 70, "RyanWatkins": 100, "CryptoMaestro": 80, "gabrieltanhl": 80,
+    "fomosaurus": 70, "mayazi": 70, "litocoen": 70, "mrjasonchoi": 100, 
+    "redphonecrypto": 80, "lalleclausen": 70, "QwQiao": 80, "Arthur_0x": 80, 
+    "riabhutoria": 70, "pythianism": 70, "0xMaki": 100, "AustinBarack": 80, 
+    "guywuolletjr": 70, "0x_Osprey": 80, "dberenzon": 100, "_kinjalbshah": 100, 
+    "yanr0ux": 70, "Shaughnessy119": 80, "cuysheffield": 100, "RoyLearner": 70,
+    "KyleSamani": 100, "nanexcool": 100, "austingriffith": 100, "0xmubaris": 70, 
+    "richardchen39": 70, "pet3rpan_": 80, "Casey": 70, "Mable_Jiang": 100, 
+    "tklocanas": 70, "AndrewSteinwold": 80, "joonian": 70, "ConvexMonster": 80, 
+    "gmoneyNFT": 100, "carlosecgomes": 70, "thattallguy": 70, "trent_vanepps": 80,
+    "Flynnjamm": 70, "pranksy": 100, "Jihoz_Axie": 100, "js_horne": 70, 
+    "gabagooldoteth": 70, "GarrettCAllen": 80, "ASvanevik": 80, "polats": 70, 
+    "0xstephb": 80, "heyellieday": 70, "__mikareyes": 70, "Rebecca_Mqamelo": 70,
+    "vsinghdothings": 70, "mikedemarais": 70, "beaniemaxi": 80, "rleshner": 100, 
+    "stablekwon": 100, "_trente_": 70, "0xmons": 70, "JosephTodaro_": 80, 
+    "tonysheng": 100, "ai": 100, "mattysino": 70, "calchulus": 70, "MarkBeylin": 80, 
+    "mg": 70, "masonnystrom": 70, "fvckrender": 60, "mhonkasalo": 70,
+    "KeyboardMonkey3": 60, "scott_lew_is": 70, "loomdart": 60, "Paul_Burlage": 70,
+    "camron_miraftab": 70, "DeezeFi": 70, "AlexMasmej": 90, "johnx25bd": 70, 
+    "NazzMass": 70, "notscottmoore": 80, "garythung": 70, "thatguybg": 60, 
+    "finn_meeks": 60, "cicici__ci": 60, "muhnkee": 60, "Block49Capital": 80,
+    "0xedenau": 70, "jonwu_": 80, "simondlr": 90, "algofamily": 70, 
+    "SOLBigBrain": 70, "AustinGreen": 70, "Zeneca_33": 100, "jkuanderulo": 70,
+    "ViktorBunin": 90, "benjaminsimon97": 70, "JaschaSamadi": 70,
+    "aeyakovenko": 80, "sandeepnailwal": 80, "dcfgod": 80, "balajis": 80,
+    "rajgokal": 80, "0xMert_": 80, "samkazemian": 80, "PaulTaylorVC": 80,
+    "TheOnlyNom": 80, "gdog97_": 80, "michaelh_0g": 80, "will__price": 80,
+    "zmanian": 80, "sreeramkannan": 80, "gametheorizing": 80, "Melt_Dem": 80,
+    "SimkinStepan": 80, "rushimanche": 80, "ekrahm": 80, "PrimordialAA": 80,
+    "baalazamon": 80, "kashdhandam": 80, "mrblockw": 80, "chainyoda": 80,
+    "comfycapital_": 80, "keoneHD": 80,
+    "0xave": 80, "TusharJain_": 80, "tomhschmidt": 80, "nic__carter": 80,
+    "mdudas": 80, "JReedRosenthal": 80, "jessewldn": 80, "Hootie_R": 80,
+    "FranklinBi": 80, "evanbfish": 80, "brezshares": 80, "tolycrypto": 80,
+    "alpackaP": 80, "simonkim_nft": 80, "ZeMariaMacedo": 80, "brevsin": 80,
+    "CryptoHayes": 80, "avichal": 80, "MapleLeafCap": 80, "tekinsalimi": 80,
+    "kaiynnе": 80, "yidagao": 80, "meigga": 80, "emmacui": 80, "DAnconia_Crypto": 80,
+    "zacxbt": 80, "Defi0xJeff": 80,
+    "_dshap": 80, "JasonYanowitz": 80, "MichaelIppo": 80, "SteimetzKinji": 80,
+    "AvgJoesCrypto": 80, "defi_monk": 80, "0xCryptoSam": 80, "Solofunk_": 80,
+    "dylangbane": 80, "0xMether": 80, "salveboccaccio": 80, "EffortCapital": 80,
+    "Kunallegendd": 80, "jon_charb": 80, "shaundadevens": 80, "0xcarlosg": 80,
+    "defi_kay_": 80, "marcarjoon": 80, "_ryanrconnor": 80, "smyyguy": 80,
+    "WestieCapital": 80, "ItsFloe": 80, "PlagueObserver": 80, "luisri_": 80,
+    "0xWeiler": 80,
+})
+_POWER_USERS_LIST = list(_POWER_USERS_SCORES)
+_POWER_USERS_LOWER = {u.lower(): u for u in _POWER_USERS_SCORES}
+_POWER_USERS_LOWER_SET = frozenset(_POWER_USERS_LOWER)
+_POWER_USERS_INDEX = {u: i for i, u in enumerate(_POWER_USERS_LIST)}
+
 
 @dataclass
 class ScoringCriteria:
@@ -41,36 +136,63 @@ class DatabaseManager:
     def __init__(self, db_path: str = "crypto_intelligence.db"):
         self.db_path = os.path.abspath(db_path)
         print(f"📁 Database path: {self.db_path}")
+        # One long-lived connection in autocommit mode instead of reopening per call
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=2147483648;
+            PRAGMA busy_timeout=5000;
+        ''')
+        atexit.register(self.close)
         self.init_database()
 
+    def close(self):
+        """Run PRAGMA optimize and close the connection"""
+        if self.conn is None:
+            return
+        try:
+            self.conn.execute("PRAGMA optimize")
+        finally:
+            self.conn.close()
+            self.conn = None
+
+    # NOCASE makes the UNIQUE index on handle case-insensitive and usable for lookups
+    COMPANIES_SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            handle TEXT NOT NULL UNIQUE COLLATE NOCASE,
+            bio TEXT,
+            followers_count INTEGER,
+            creation_date TEXT,
+            creation_weeks_old INTEGER,
+            follower_score INTEGER,
+            creation_score INTEGER,
+            keyword_score INTEGER,
+            link_score INTEGER,
+            power_user_score INTEGER,
+            total_score INTEGER,
+            discovered_date TEXT,
+            power_users_following TEXT,
+            keywords_found TEXT,
+            links_found TEXT,
+            verified BOOLEAN,
+            is_protected BOOLEAN,
+            last_updated TEXT
+        )
+    '''
+
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS companies (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                handle TEXT UNIQUE NOT NULL,
-                bio TEXT,
-                followers_count INTEGER,
-                creation_date TEXT,
-                creation_weeks_old INTEGER,
-                follower_score INTEGER,
-                creation_score INTEGER,
-                keyword_score INTEGER,
-                link_score INTEGER,
-                power_user_score INTEGER,
-                total_score INTEGER,
-                discovered_date TEXT,
-                power_users_following TEXT,
-                keywords_found TEXT,
-                links_found TEXT,
-                verified BOOLEAN,
-                is_protected BOOLEAN,
-                last_updated TEXT
-            )
-        ''')
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'companies'")
+        row = cursor.fetchone()
+        if row and 'COLLATE NOCASE' not in row[0].upper():
+            self._migrate_companies_nocase(cursor)
+        cursor.execute(self.COMPANIES_SCHEMA.format(table='companies'))
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS api_runs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -84,43 +206,81 @@ class DatabaseManager:
                 filtered_age INTEGER
             )
         ''')
-        conn.commit()
         cursor.execute("SELECT COUNT(*) FROM companies")
         company_count = cursor.fetchone()[0]
-        conn.close()
+        cursor.close()
         print(f"✅ Database initialized with {company_count} existing companies")
 
+    def _migrate_companies_nocase(self, cursor):
+        """Rebuild an older companies table with a case-insensitive handle column"""
+        print("🔧 Migrating companies table to case-insensitive handles...")
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute("ALTER TABLE companies RENAME TO companies_old")
+            cursor.execute(self.COMPANIES_SCHEMA.format(table='companies'))
+            # Case-duplicate handles collapse to the most recently updated row
+            cursor.execute(
+                "INSERT OR IGNORE INTO companies SELECT * FROM companies_old "
+                "ORDER BY last_updated DESC, id DESC"
+            )
+            cursor.execute("SELECT (SELECT COUNT(*) FROM companies_old) - (SELECT COUNT(*) FROM companies)")
+            dropped = cursor.fetchone()[0]
+            cursor.execute("DROP TABLE companies_old")
+            cursor.execute("COMMIT")
+            if dropped:
+                print(f"⚠️ Dropped {dropped} older rows whose handles differed only by case")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
     def company_exists(self, handle: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM companies WHERE LOWER(handle) = LOWER(?)", (handle,))
+        cursor = self.conn.execute("SELECT 1 FROM companies WHERE handle = ?", (handle,))
         exists = cursor.fetchone() is not None
-        conn.close()
+        cursor.close()
         return exists
 
     def get_all_handles(self) -> set:
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT handle FROM companies")
+            cursor = self.conn.execute("SELECT handle FROM companies")
             handles = {row[0].lower() for row in cursor.fetchall()}
-            conn.close()
+            cursor.close()
             return handles
         except Exception as e:
             print(f"Warning: Could not get existing handles: {e}")
             return set()
 
-    def save_company(self, company_data: Dict):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO companies (
-                name, handle, bio, followers_count, creation_date, creation_weeks_old,
-                follower_score, creation_score, keyword_score, link_score, power_user_score,
-                total_score, discovered_date, power_users_following, keywords_found,
-                links_found, verified, is_protected, last_updated
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    COMPANY_INSERT_SQL = '''
+        INSERT {or_ignore}INTO companies (
+            name, handle, bio, followers_count, creation_date, creation_weeks_old,
+            follower_score, creation_score, keyword_score, link_score, power_user_score,
+            total_score, discovered_date, power_users_following, keywords_found,
+            links_found, verified, is_protected, last_updated
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    # Update in place on a known handle, keeping the row id and discovered_date
+    COMPANY_UPSERT_CLAUSE = '''
+        ON CONFLICT(handle) DO UPDATE SET
+            bio = excluded.bio,
+            followers_count = excluded.followers_count,
+            creation_weeks_old = excluded.creation_weeks_old,
+            follower_score = excluded.follower_score,
+            creation_score = excluded.creation_score,
+            keyword_score = excluded.keyword_score,
+            link_score = excluded.link_score,
+            power_user_score = excluded.power_user_score,
+            total_score = excluded.total_score,
+            power_users_following = excluded.power_users_following,
+            keywords_found = excluded.keywords_found,
+            links_found = excluded.links_found,
+            verified = excluded.verified,
+            is_protected = excluded.is_protected,
+            last_updated = excluded.last_updated
+    '''
+
+    @staticmethod
+    def _company_row(company_data: Dict, last_updated: str) -> Tuple:
+        return (
             company_data['name'], company_data['handle'], company_data['bio'],
             company_data['followers_count'], company_data['creation_date'],
             company_data['creation_weeks_old'], company_data['follower_score'],
@@ -131,24 +291,47 @@ class DatabaseManager:
             ','.join(company_data['keywords_found']),
             ','.join(company_data['links_found']),
             company_data['verified'], company_data['is_protected'],
-            datetime.now().isoformat()
-        ))
-        conn.commit()
-        conn.close()
+            last_updated
+        )
+
+    def save_company(self, company_data: Dict):
+        self.conn.execute(self.COMPANY_INSERT_SQL.format(or_ignore='') + self.COMPANY_UPSERT_CLAUSE,
+                          self._company_row(company_data, datetime.now().isoformat()))
+
+    def save_companies_bulk(self, rows: List[Dict]) -> set:
+        """Save many companies in a single transaction; returns handles that could not be stored"""
+        # OR IGNORE would also swallow NOT NULL violations, so reject those rows up front
+        rejected = {row['handle'] for row in rows if row.get('name') is None or not row.get('handle')}
+        for handle in rejected:
+            print(f"Warning: Not saving {handle}: missing name or handle")
+        rows = [row for row in rows if row['handle'] not in rejected]
+        if not rows:
+            return rejected
+        last_updated = datetime.now().isoformat()
+        tuples = [self._company_row(row, last_updated) for row in rows]
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            cursor.executemany(self.COMPANY_INSERT_SQL.format(or_ignore='OR IGNORE '), tuples)
+            if cursor.rowcount < len(tuples):
+                print(f"Warning: {len(tuples) - cursor.rowcount} companies already in database, skipped")
+            cursor.execute("COMMIT")
+        except Exception:
+            if self.conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+        return rejected
 
     def get_companies(self, min_score: int = 200) -> pd.DataFrame:
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query(
+        return pd.read_sql_query(
             "SELECT * FROM companies WHERE total_score >= ? ORDER BY total_score DESC",
-            conn, params=(min_score,)
+            self.conn, params=(min_score,)
         )
-        conn.close()
-        return df
 
     def save_api_run(self, run_data: Dict):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
+        self.conn.execute('''
             INSERT INTO api_runs (run_date, companies_discovered, total_api_calls, 
                                 power_users_processed, runtime_minutes, batch_number,
                                 filtered_followers, filtered_age)
@@ -159,8 +342,6 @@ class DatabaseManager:
             run_data['runtime_minutes'], run_data.get('batch_number', 0),
             run_data.get('filtered_followers', 0), run_data.get('filtered_age', 0)
         ))
-        conn.commit()
-        conn.close()
 
 
 class CryptoIntelligencePlatform:
@@ -170,65 +351,30 @@ class CryptoIntelligencePlatform:
         self.api_key = api_key
         self.base_url = "https://api.sorsa.io/v2"  # SORSA API
         self.headers = {"ApiKey": api_key, "Accept": "application/json"}
+        # One pooled HTTP/2 client so concurrent calls share a connection
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url, headers=self.headers, http2=True, timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
         self.db = DatabaseManager()
         self.scoring = ScoringCriteria()
 
-        # Power users with their signal scores
-        self.power_users_scores = {
-            "NTmoney": 100, "zhusu": 100, "AriannaSimpson": 100, "santiagoroel": 100, 
-            "StaniKulechov": 100, "eddylazzarin": 100, "adampatel23": 100, "jbrukh": 100, 
-            "spencernoon": 100, "MonetSupply": 90, "arjunblj": 100, "janehk": 100, 
-            "Derekmw23": 100, "0xminion": 100, "MerschMax_": 100, "bneiluj": 100,
-            "Iiterature": 100, "panekkkk": 100, "zoink": 100, "gpl_94": 90, 
-            "WuCarra": 80, "bitcoinPalmer": 70, "Darrenlautf": 80, "john_c_palmer": 70, 
-            "lmrankhan": 70, "WPeaster": 80, "bottomd0g": 70, "dApp_boi": 70, 
-            "sethginns": 70, "RyanWatkins": 100, "CryptoMaestro": 80, "gabrieltanhl": 80,
-            "fomosaurus": 70, "mayazi": 70, "litocoen": 70, "mrjasonchoi": 100, 
-            "redphonecrypto": 80, "lalleclausen": 70, "QwQiao": 80, "Arthur_0x": 80, 
-            "riabhutoria": 70, "pythianism": 70, "0xMaki": 100, "AustinBarack": 80, 
-            "guywuolletjr": 70, "0x_Osprey": 80, "dberenzon": 100, "_kinjalbshah": 100, 
-            "yanr0ux": 70, "Shaughnessy119": 80, "cuysheffield": 100, "RoyLearner": 70,
-            "KyleSamani": 100, "nanexcool": 100, "austingriffith": 100, "0xmubaris": 70, 
-            "richardchen39": 70, "pet3rpan_": 80, "Casey": 70, "Mable_Jiang": 100, 
-            "tklocanas": 70, "AndrewSteinwold": 80, "joonian": 70, "ConvexMonster": 80, 
-            "gmoneyNFT": 100, "carlosecgomes": 70, "thattallguy": 70, "trent_vanepps": 80,
-            "Flynnjamm": 70, "pranksy": 100, "Jihoz_Axie": 100, "js_horne": 70, 
-            "gabagooldoteth": 70, "GarrettCAllen": 80, "ASvanevik": 80, "polats": 70, 
-            "0xstephb": 80, "heyellieday": 70, "__mikareyes": 70, "Rebecca_Mqamelo": 70,
-            "vsinghdothings": 70, "mikedemarais": 70, "beaniemaxi": 80, "rleshner": 100, 
-            "stablekwon": 100, "_trente_": 70, "0xmons": 70, "JosephTodaro_": 80, 
-            "tonysheng": 100, "ai": 100, "mattysino": 70, "calchulus": 70, "MarkBeylin": 80, 
-            "mg": 70, "masonnystrom": 70, "fvckrender": 60, "mhonkasalo": 70,
-            "KeyboardMonkey3": 60, "scott_lew_is": 70, "loomdart": 60, "Paul_Burlage": 70,
-            "camron_miraftab": 70, "DeezeFi": 70, "AlexMasmej": 90, "johnx25bd": 70, 
-            "NazzMass": 70, "notscottmoore": 80, "garythung": 70, "thatguybg": 60, 
-            "finn_meeks": 60, "cicici__ci": 60, "muhnkee": 60, "Block49Capital": 80,
-            "0xedenau": 70, "jonwu_": 80, "simondlr": 90, "algofamily": 70, 
-            "SOLBigBrain": 70, "AustinGreen": 70, "Zeneca_33": 100, "jkuanderulo": 70,
-            "ViktorBunin": 90, "benjaminsimon97": 70, "JaschaSamadi": 70,
-            "aeyakovenko": 80, "sandeepnailwal": 80, "dcfgod": 80, "balajis": 80,
-            "rajgokal": 80, "0xMert_": 80, "samkazemian": 80, "PaulTaylorVC": 80,
-            "TheOnlyNom": 80, "gdog97_": 80, "michaelh_0g": 80, "will__price": 80,
-            "zmanian": 80, "sreeramkannan": 80, "gametheorizing": 80, "Melt_Dem": 80,
-            "SimkinStepan": 80, "rushimanche": 80, "ekrahm": 80, "PrimordialAA": 80,
-            "baalazamon": 80, "kashdhandam": 80, "mrblockw": 80, "chainyoda": 80,
-            "comfycapital_": 80, "keoneHD": 80,
-            "0xave": 80, "TusharJain_": 80, "tomhschmidt": 80, "nic__carter": 80,
-            "mdudas": 80, "JReedRosenthal": 80, "jessewldn": 80, "Hootie_R": 80,
-            "FranklinBi": 80, "evanbfish": 80, "brezshares": 80, "tolycrypto": 80,
-            "alpackaP": 80, "simonkim_nft": 80, "ZeMariaMacedo": 80, "brevsin": 80,
-            "CryptoHayes": 80, "avichal": 80, "MapleLeafCap": 80, "tekinsalimi": 80,
-            "kaiynnе": 80, "yidagao": 80, "meigga": 80, "emmacui": 80, "DAnconia_Crypto": 80,
-            "zacxbt": 80, "Defi0xJeff": 80,
-            "_dshap": 80, "JasonYanowitz": 80, "MichaelIppo": 80, "SteimetzKinji": 80,
-            "AvgJoesCrypto": 80, "defi_monk": 80, "0xCryptoSam": 80, "Solofunk_": 80,
-            "dylangbane": 80, "0xMether": 80, "salveboccaccio": 80, "EffortCapital": 80,
-            "Kunallegendd": 80, "jon_charb": 80, "shaundadevens": 80, "0xcarlosg": 80,
-            "defi_kay_": 80, "marcarjoon": 80, "_ryanrconnor": 80, "smyyguy": 80,
-            "WestieCapital": 80, "ItsFloe": 80, "PlagueObserver": 80, "luisri_": 80,
-            "0xWeiler": 80,
-        }
-        self.power_users = list(self.power_users_scores.keys())
+        # Threshold lists are sorted ascending, so scoring is a bisect lookup
+        self._follower_thr = [t for t, _ in self.scoring.follower_thresholds]
+        self._follower_score = [s for _, s in self.scoring.follower_thresholds]
+        self._creation_thr = [t for t, _ in self.scoring.creation_date_thresholds]
+        self._creation_score = [s for _, s in self.scoring.creation_date_thresholds]
+        # Array copies for whole-list scoring; the trailing 0 scores values past the last threshold
+        self._follower_thr_arr = np.array(self._follower_thr, dtype=np.int64)
+        self._follower_score_arr = np.array(self._follower_score + [0], dtype=np.int64)
+        self._creation_thr_arr = np.array(self._creation_thr, dtype=np.int64)
+        self._creation_score_arr = np.array(self._creation_score + [0], dtype=np.int64)
+
+        self.power_users_scores = _POWER_USERS_SCORES
+        self.power_users = _POWER_USERS_LIST
+        self._power_users_lower_map = _POWER_USERS_LOWER
+        self._power_users_lower_set = _POWER_USERS_LOWER_SET
+        self._power_users_index = _POWER_USERS_INDEX
 
         self.crypto_keywords = [
             "nft", "cross-chain", "multi-chain", "data", "analytics", "aggregator", 
@@ -249,6 +395,12 @@ class CryptoIntelligencePlatform:
             "tools", "tooling", "service", "rwa", "real-world-assets"
         ]
 
+        # Single-pass multi-pattern matcher over the bio; payload keeps list order
+        self._kw_automaton = ahocorasick.Automaton()
+        for idx, keyword in enumerate(self.crypto_keywords):
+            self._kw_automaton.add_word(keyword.lower(), (idx, keyword))
+        self._kw_automaton.make_automaton()
+
     def extract_handle(self, account_data: Dict) -> str:
         screenName = account_data.get('screenName', '').strip()
         if screenName:
@@ -258,7 +410,7 @@ class CryptoIntelligencePlatform:
             return screeName
         name = account_data.get('name', '').strip()
         if name:
-            handle = re.sub(r'[^\w\.]', '', name)
+            handle = _HANDLE_SANITIZE_RE.sub('', name)
             if handle and len(handle) > 2:
                 return handle
         user_id = account_data.get('id', '')
@@ -266,11 +418,12 @@ class CryptoIntelligencePlatform:
             return f"user_{user_id}"
         return ''
 
-    def get_new_following_7d(self, user_handle: str) -> Optional[List[Dict]]:
-        url = f"{self.base_url}/new-following-7d"
-        params = {"user_handle": user_handle}
+    async def aclose(self):
+        await self._http.aclose()
+
+    async def get_new_following_7d(self, user_handle: str) -> Optional[List[Dict]]:
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = await self._http.get("/new-following-7d", params={"user_handle": user_handle})
             if response.status_code == 200:
                 data = response.json()
                 logger.info(f"✓ {user_handle}: {len(data)} new follows")
@@ -281,58 +434,46 @@ class CryptoIntelligencePlatform:
             else:
                 logger.error(f"✗ {user_handle}: Error {response.status_code}")
                 return None
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(f"✗ {user_handle}: Request error - {e}")
             return None
 
-    def get_top_followers(self, user_handle: str) -> Optional[List[Dict]]:
-        url = f"{self.base_url}/top-following/{user_handle}"
+    async def get_top_followers(self, user_handle: str) -> Optional[List[Dict]]:
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = await self._http.get(f"/top-following/{user_handle}")
             if response.status_code == 200:
                 return response.json()
             else:
                 logger.warning(f"⚠ Could not get top followers for {user_handle}: {response.status_code}")
                 return []
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(f"✗ Top followers error for {user_handle}: {e}")
             return []
 
-    def calculate_account_age_weeks(self, created_at: str) -> int:
-        try:
-            if created_at:
-                if created_at.endswith('Z'):
-                    creation_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                else:
-                    creation_date = datetime.fromisoformat(created_at)
-                creation_date = creation_date.replace(tzinfo=None)
-                age_weeks = (datetime.now() - creation_date).days // 7
-                return max(0, age_weeks)
-        except Exception as e:
-            logger.warning(f"Could not parse date {created_at}: {e}")
-        return 999
+    def calculate_account_age_weeks(self, created_at: str, now_day: Optional[int] = None) -> int:
+        if now_day is None:
+            now_day = current_epoch_day()
+        return _age_weeks(created_at, now_day)
 
     def score_follower_count(self, count: int) -> int:
-        for threshold, score in self.scoring.follower_thresholds:
-            if count <= threshold:
-                return score
-        return 0
+        i = bisect.bisect_left(self._follower_thr, count)
+        return self._follower_score[i] if i < len(self._follower_score) else 0
 
     def score_creation_date(self, weeks_old: int) -> int:
-        for threshold, score in self.scoring.creation_date_thresholds:
-            if weeks_old <= threshold:
-                return score
-        return 0
+        i = bisect.bisect_left(self._creation_thr, weeks_old)
+        return self._creation_score[i] if i < len(self._creation_score) else 0
+
+    def score_follower_counts(self, counts: np.ndarray) -> np.ndarray:
+        return self._follower_score_arr[np.searchsorted(self._follower_thr_arr, counts, side='left')]
+
+    def score_creation_dates(self, weeks_old: np.ndarray) -> np.ndarray:
+        return self._creation_score_arr[np.searchsorted(self._creation_thr_arr, weeks_old, side='left')]
 
     def find_keywords_in_bio(self, bio: str) -> Tuple[List[str], int]:
         if not bio:
             return [], 0
-        bio_lower = bio.lower()
-        found_keywords = []
-        for keyword in self.crypto_keywords:
-            if keyword.lower() in bio_lower:
-                found_keywords.append(keyword)
-        found_keywords = list(dict.fromkeys(found_keywords))
+        matches = {payload for _, payload in self._kw_automaton.iter(bio.lower())}
+        found_keywords = [keyword for _, keyword in sorted(matches)]
         return found_keywords, len(found_keywords) * self.scoring.keyword_score
 
     def find_links_in_bio(self, bio: str) -> Tuple[List[str], int]:
@@ -347,15 +488,13 @@ class CryptoIntelligencePlatform:
         if any(word in bio_lower for word in ['telegram', 't.me', 'tg://']):
             found_links.append('Telegram Channel')
             total_score += self.scoring.link_scores['telegram']
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, bio)
-        if urls and not found_links:
+        if not found_links and _URL_RE.search(bio) is not None:
             found_links.append('Website URL')
             total_score += self.scoring.link_scores['website']
         return found_links, total_score
 
-    def check_power_user_followers(self, account_handle: str) -> Tuple[List[str], int]:
-        top_followers = self.get_top_followers(account_handle)
+    async def check_power_user_followers(self, account_handle: str) -> Tuple[List[str], int]:
+        top_followers = await self.get_top_followers(account_handle)
         if not top_followers:
             return [], 0
         top_follower_handles = set()
@@ -363,16 +502,17 @@ class CryptoIntelligencePlatform:
             handle = self.extract_handle(follower).lower()
             if handle:
                 top_follower_handles.add(handle)
-        power_user_matches = []
-        total_score = 0
-        for power_user in self.power_users:
-            if power_user.lower() in top_follower_handles:
-                power_user_matches.append(power_user)
-                user_score = self.power_users_scores.get(power_user, 70)
-                total_score += user_score
+        matched_lower = top_follower_handles & self._power_users_lower_set
+        # Report matches in power_users order, not set iteration order
+        power_user_matches = sorted((self._power_users_lower_map[lower] for lower in matched_lower),
+                                    key=self._power_users_index.__getitem__)
+        total_score = sum(self.power_users_scores[match] for match in power_user_matches)
         return power_user_matches, total_score
 
-    def score_account(self, account_data: Dict, discovered_by: str) -> Dict:
+    def score_account(self, account_data: Dict, discovered_by: str,
+                      weeks_old: Optional[int] = None,
+                      follower_score: Optional[int] = None,
+                      creation_score: Optional[int] = None) -> Dict:
         handle = self.extract_handle(account_data)
         name = account_data.get('name', '')
         bio = account_data.get('description', '')
@@ -381,9 +521,12 @@ class CryptoIntelligencePlatform:
         verified = account_data.get('verified', False)
         is_protected = account_data.get('protected', False)
 
-        weeks_old = self.calculate_account_age_weeks(created_at)
-        follower_score = self.score_follower_count(followers_count)
-        creation_score = self.score_creation_date(weeks_old)
+        if weeks_old is None:
+            weeks_old = self.calculate_account_age_weeks(created_at)
+        if follower_score is None:
+            follower_score = self.score_follower_count(followers_count)
+        if creation_score is None:
+            creation_score = self.score_creation_date(weeks_old)
         keywords_found, keyword_score = self.find_keywords_in_bio(bio)
         links_found, link_score = self.find_links_in_bio(bio)
         
@@ -408,8 +551,8 @@ class CryptoIntelligencePlatform:
         }
 
 
-def upload_to_google_sheet(df, sheet_id, sheet_name=None):
-    """Upload results to Google Sheets"""
+def upload_to_google_sheet(records, sheet_id, sheet_name=None):
+    """Upload results (a DataFrame or list of dicts) to Google Sheets"""
     try:
         import gspread
         from google.oauth2.service_account import Credentials
@@ -433,11 +576,10 @@ def upload_to_google_sheet(df, sheet_id, sheet_name=None):
             worksheet.clear()
 
         # Prepare data
-        sheets_df = df.copy()
-        sheets_df['twitter_link'] = 'https://twitter.com/' + sheets_df['handle'].astype(str)
-        sheets_df['handle'] = sheets_df['handle'].astype(str).apply(
-            lambda x: x if str(x).startswith('@') else '@' + str(x)
-        )
+        sheets_df = pd.DataFrame(records)
+        handles = sheets_df['handle'].astype(str)
+        sheets_df['twitter_link'] = 'https://twitter.com/' + handles
+        sheets_df['handle'] = handles.where(handles.str.startswith('@'), '@' + handles)
         
         columns = ['name', 'handle', 'twitter_link', 'total_score', 'followers_count', 'bio', 
                    'power_users_following', 'keywords_found', 'creation_date']
@@ -447,27 +589,18 @@ def upload_to_google_sheet(df, sheet_id, sheet_name=None):
         if 'bio' in sheets_df.columns:
             sheets_df['bio'] = sheets_df['bio'].astype(str).str[:200]
 
-        # Clean values
-        def clean_value(value):
-            if value is None:
-                return ""
-            elif isinstance(value, (list, tuple)):
-                return ", ".join(str(item) for item in value)
-            elif isinstance(value, dict):
-                return str(value)
-            elif isinstance(value, bool):
-                return str(value)
-            else:
-                cleaned = str(value).replace('\n', ' ').replace('\r', ' ')
-                return cleaned[:500]
-
-        data_to_upload = [sheets_df.columns.values.tolist()]
-        for _, row in sheets_df.iterrows():
-            cleaned_row = [clean_value(val) for val in row.values]
-            data_to_upload.append(cleaned_row)
-
-        worksheet.update('A1', data_to_upload)
-        print(f"✅ Uploaded {len(df)} companies to Google Sheets!")
+        # Clean values column-wise instead of per cell
+        for col in ('power_users_following', 'keywords_found'):
+            if col in sheets_df.columns:
+                sheets_df[col] = sheets_df[col].map(
+                    lambda v: ', '.join(str(item) for item in v) if isinstance(v, (list, tuple)) else v
+                )
+        sheets_df = sheets_df.fillna('').astype(str).replace({r'[\r\n]': ' '}, regex=True)
+        sheets_df = sheets_df.apply(lambda col: col.str.slice(0, 500))
+
+        data_to_upload = [sheets_df.columns.tolist()] + sheets_df.values.tolist()
+        worksheet.update('A1', data_to_upload, value_input_option='RAW')
+        print(f"✅ Uploaded {len(records)} companies to Google Sheets!")
         print(f"🔗 Sheet: {sheet.url}")
         return True
 
@@ -476,7 +609,7 @@ def upload_to_google_sheet(df, sheet_id, sheet_name=None):
         return False
 
 
-def weekly_automation():
+async def weekly_automation(concurrency: int = 10):
     """Main function for weekly automation"""
     print("🤖 Starting weekly crypto intelligence run...")
     print(f"📅 Run date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -493,71 +626,120 @@ def weekly_automation():
     total_new_discoveries = []
     total_duplicates_skipped = 0
 
-    for batch_num in range(0, len(all_users), batch_size):
-        end_idx = min(batch_num + batch_size, len(all_users))
-        batch_users = all_users[batch_num:end_idx]
-        batch_number = (batch_num // batch_size) + 1
-
-        print(f"\n🔥 BATCH {batch_number}/{(len(all_users) + batch_size - 1) // batch_size}")
-        print(f"👥 Processing users {batch_num+1}-{end_idx}")
-
-        batch_start_time = datetime.now()
-        batch_new_discoveries = []
-        batch_duplicates = 0
+    # Bound in-flight API calls so a batch fan-out stays within rate limits
+    semaphore = asyncio.Semaphore(concurrency)
 
-        for i, power_user in enumerate(batch_users, 1):
-            print(f"  [{i}/{len(batch_users)}] Processing @{power_user}...")
-
-            new_follows = platform.get_new_following_7d(power_user)
-            if new_follows is None or not new_follows:
-                continue
-
-            for account in new_follows:
-                handle = platform.extract_handle(account)
-                if not handle:
-                    logger.debug(f"    SKIP: No handle found in account data: {account}")
-                    continue
-
-                if handle.lower() in existing_handles:
-                    batch_duplicates += 1
-                    logger.debug(f"    SKIP: {handle} - Already in database")
-                    continue
-
-                followers_count = account.get('followersCount', 0)
-                created_at = account.get('registerDate', '')
-                weeks_old = platform.calculate_account_age_weeks(created_at)
-
-                logger.info(f"    Checking {handle}: followers={followers_count}, age_weeks={weeks_old}")
-
-                if followers_count > 5000:
-                    logger.info(f"    SKIP: {handle} - Too many followers ({followers_count})")
-                    continue
-                
-                if weeks_old > 104:
-                    logger.info(f"    SKIP: {handle} - Too old ({weeks_old} weeks)")
-                    continue
+    async def fetch_new_follows(user):
+        # One user's failure must not cancel the rest of the batch
+        try:
+            async with semaphore:
+                return user, await platform.get_new_following_7d(user)
+        except Exception as e:
+            logger.error(f"✗ {user}: Unexpected fetch error - {e}")
+            return user, None
 
-                try:
-                    scored_account = platform.score_account(account, power_user)
-                    if scored_account['total_score'] >= 200:
-                        platform.db.save_company(scored_account)
-                        batch_new_discoveries.append(scored_account)
-                        existing_handles.add(handle.lower())
-                        print(f"    ✅ {handle}: {scored_account['total_score']} points")
-                    else:
-                        logger.info(f"    SKIP: {handle} - Score too low ({scored_account['total_score']} < 200)")
-                except Exception as e:
-                    logger.error(f"    ERROR scoring {handle}: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+    try:
+        for batch_num in range(0, len(all_users), batch_size):
+            end_idx = min(batch_num + batch_size, len(all_users))
+            batch_users = all_users[batch_num:end_idx]
+            batch_number = (batch_num // batch_size) + 1
+
+            print(f"\n🔥 BATCH {batch_number}/{(len(all_users) + batch_size - 1) // batch_size}")
+            print(f"👥 Processing users {batch_num+1}-{end_idx}")
+
+            batch_start_time = datetime.now()
+            batch_duplicates = 0
+            # handle.lower() -> (position of power user in batch_users, account order, scored account).
+            # Responses arrive in any order; the earliest user in the list keeps the credit.
+            batch_claims = {}
+            batch_positions = {u: pos for pos, u in enumerate(batch_users)}
+            now_day = current_epoch_day()
+
+            # Score each user's follows as soon as they arrive, while the rest are in flight
+            tasks = [asyncio.create_task(fetch_new_follows(u)) for u in batch_users]
+
+            for i, next_done in enumerate(asyncio.as_completed(tasks), 1):
+                power_user, new_follows = await next_done
+                user_pos = batch_positions[power_user]
+                print(f"  [{i}/{len(batch_users)}] Processing @{power_user}...")
+
+                if new_follows is None or not new_follows:
                     continue
 
-            time.sleep(1.0)
-
-        batch_runtime = (datetime.now() - batch_start_time).total_seconds() / 60
-        total_new_discoveries.extend(batch_new_discoveries)
-        total_duplicates_skipped += batch_duplicates
-        print(f"  ✅ Batch {batch_number}: {len(batch_new_discoveries)} new, {batch_duplicates} duplicates, {batch_runtime:.1f}min")
+                # Columnar view of the list so the follower/age filter is one mask
+                n = len(new_follows)
+                followers = np.fromiter((a.get('followersCount', 0) for a in new_follows),
+                                        dtype=np.int64, count=n)
+                weeks = np.fromiter((platform.calculate_account_age_weeks(a.get('registerDate', ''), now_day)
+                                     for a in new_follows), dtype=np.int64, count=n)
+                mask = (followers <= 5000) & (weeks <= 104)
+                if not mask.all():
+                    logger.info(f"    SKIP: {n - int(mask.sum())} accounts over follower/age limits")
+                followers, weeks = followers[mask], weeks[mask]
+
+                # Numeric scores for the remaining accounts in one vectorized pass
+                follower_scores = platform.score_follower_counts(followers)
+                creation_scores = platform.score_creation_dates(weeks)
+
+                for seq, (account, followers_count, weeks_old, follower_score, creation_score) in enumerate(zip(
+                        itertools.compress(new_follows, mask), followers.tolist(), weeks.tolist(),
+                        follower_scores.tolist(), creation_scores.tolist())):
+                    handle = platform.extract_handle(account)
+                    if not handle:
+                        logger.debug(f"    SKIP: No handle found in account data: {account}")
+                        continue
+
+                    if handle.lower() in existing_handles:
+                        batch_duplicates += 1
+                        logger.debug(f"    SKIP: {handle} - Already in database")
+                        continue
+
+                    claim = batch_claims.get(handle.lower())
+                    if claim is not None and claim[0] <= user_pos:
+                        batch_duplicates += 1
+                        logger.debug(f"    SKIP: {handle} - Already claimed by @{claim[2]['power_users_following'][0]}")
+                        continue
+
+                    logger.info(f"    Checking {handle}: followers={followers_count}, age_weeks={weeks_old}")
+
+                    try:
+                        scored_account = platform.score_account(
+                            account, power_user,
+                            weeks_old=weeks_old,
+                            follower_score=follower_score,
+                            creation_score=creation_score,
+                        )
+                        if scored_account['total_score'] >= 200:
+                            if claim is not None:
+                                batch_duplicates += 1
+                            batch_claims[handle.lower()] = (user_pos, seq, scored_account)
+                            print(f"    ✅ {handle}: {scored_account['total_score']} points")
+                        else:
+                            logger.info(f"    SKIP: {handle} - Score too low ({scored_account['total_score']} < 200)")
+                    except Exception as e:
+                        logger.error(f"    ERROR scoring {handle}: {e}")
+                        import traceback
+                        logger.error(traceback.format_exc())
+                        continue
+
+            batch_new_discoveries = [scored for _, _, scored in sorted(batch_claims.values(), key=lambda c: c[:2])]
+            existing_handles.update(batch_claims)
+            try:
+                rejected = platform.db.save_companies_bulk(batch_new_discoveries)
+                if rejected:
+                    existing_handles.difference_update(h.lower() for h in rejected)
+                    batch_new_discoveries = [c for c in batch_new_discoveries if c['handle'] not in rejected]
+            except sqlite3.Error as e:
+                # Unsaved accounts are left out of the report so next week can pick them up again
+                logger.error(f"  ERROR saving batch {batch_number} ({len(batch_new_discoveries)} companies): {e}")
+                existing_handles.difference_update(c['handle'].lower() for c in batch_new_discoveries)
+                batch_new_discoveries = []
+            batch_runtime = (datetime.now() - batch_start_time).total_seconds() / 60
+            total_new_discoveries.extend(batch_new_discoveries)
+            total_duplicates_skipped += batch_duplicates
+            print(f"  ✅ Batch {batch_number}: {len(batch_new_discoveries)} new, {batch_duplicates} duplicates, {batch_runtime:.1f}min")
+    finally:
+        await platform.aclose()
 
     # Final summary
     print(f"\n🎉 WEEKLY RUN COMPLETE!")
@@ -565,8 +747,6 @@ def weekly_automation():
     print(f"🔄 Total duplicates skipped: {total_duplicates_skipped}")
 
     if total_new_discoveries:
-        new_discoveries_df = pd.DataFrame(total_new_discoveries)
-
         print(f"\n🏆 TOP NEW DISCOVERIES THIS WEEK:")
         print("-" * 70)
         for discovery in total_new_discoveries[:10]:
@@ -576,20 +756,23 @@ def weekly_automation():
         # Save CSV
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         new_filename = f"NEW_WEEKLY_discoveries_{timestamp}.csv"
-        new_discoveries_df.to_csv(new_filename, index=False)
+        with open(new_filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(total_new_discoveries[0].keys()))
+            writer.writeheader()
+            writer.writerows(total_new_discoveries)
         print(f"\n💾 NEW discoveries saved: {new_filename}")
 
         # Upload to Google Sheets
         if 'GOOGLE_SHEETS_ID' in os.environ and 'GOOGLE_SHEETS_CREDS' in os.environ:
             print("📊 Uploading to Google Sheets...")
             sheet_name = f"NEW Week {timestamp[:8]}"
-            upload_to_google_sheet(new_discoveries_df, os.environ['GOOGLE_SHEETS_ID'], sheet_name)
+            upload_to_google_sheet(total_new_discoveries, os.environ['GOOGLE_SHEETS_ID'], sheet_name)
 
-        return new_discoveries_df
+        return total_new_discoveries
     else:
         print("🔍 No new high-scoring companies discovered this week")
-        return pd.DataFrame()
+        return []
 
 
 if __name__ == "__main__":
-    weekly_automation()
+    asyncio.run(weekly_automation())